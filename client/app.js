@@ -8,6 +8,9 @@ class TelegramChatApp {
         this.isTyping = false;
         this.typingTimeout = null;
         this.lastMessageId = 0;
+        this.nextCursor = null;
+        this.hasMoreMessages = false;
+        this.loadingOlder = false;
         this.emojiPickerVisible = false;
         
         // Инициализация
@@ -135,16 +138,60 @@ class TelegramChatApp {
             });
             
             this.lastMessageId = data.messages.length > 0 ? data.messages[data.messages.length - 1].id : 0;
+            this.nextCursor = data.next_cursor;
+            this.hasMoreMessages = data.has_more;
             
             // Прокручиваем вниз
             this.scrollToBottom();
             
+            // Подгружаем историю при прокрутке к началу
+            container.onscroll = () => {
+                if (container.scrollTop < 50) {
+                    this.loadOlderMessages();
+                }
+            };
+            
         } catch (error) {
             console.error('Error loading messages:', error);
             this.showError('Ошибка загрузки сообщений');
         }
     }
     
+    async loadOlderMessages() {
+        if (this.loadingOlder || !this.hasMoreMessages || !this.nextCursor) {
+            return;
+        }
+        
+        this.loadingOlder = true;
+        try {
+            const response = await fetch(`${this.apiUrl}/api/chat/messages?limit=50&before_id=${this.nextCursor}`);
+            const data = await response.json();
+            
+            if (!data.success) {
+                throw new Error('Failed to load messages');
+            }
+            
+            const container = document.getElementById('messages-container');
+            const previousHeight = container.scrollHeight;
+            
+            // Вставляем в начало, от новых к старым
+            for (let i = data.messages.length - 1; i >= 0; i--) {
+                this.displayMessage(data.messages[i], true);
+            }
+            
+            // Сохраняем позицию прокрутки
+            container.scrollTop += container.scrollHeight - previousHeight;
+            
+            this.nextCursor = data.next_cursor;
+            this.hasMoreMessages = data.has_more;
+            
+        } catch (error) {
+            console.error('Error loading older messages:', error);
+        } finally {
+            this.loadingOlder = false;
+        }
+    }
+    
     connectWebSocket() {
         try {
             // Подключаемся к WebSocket серверу
@@ -220,7 +267,7 @@ class TelegramChatApp {
         }
     }
     
-    displayMessage(message) {
+    displayMessage(message, prepend = false) {
         const container = document.getElementById('messages-container');
         const isOwn = message.user && message.user.id === this.user.id;
         
@@ -317,7 +364,11 @@ class TelegramChatApp {
             </div>
         `;
         
-        container.appendChild(messageEl);
+        if (prepend) {
+            container.insertBefore(messageEl, container.firstChild);
+        } else {
+            container.appendChild(messageEl);
+        }
         
         // Если это свое сообщение, убираем индикатор загрузки после сохранения
         if (isOwn && message.pending) {